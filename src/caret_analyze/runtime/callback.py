@@ -14,7 +14,10 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+from functools import lru_cache
+from operator import attrgetter
+from sys import intern
+from typing import List, Optional, Tuple
 
 from .path_base import PathBase
 from .publisher import Publisher
@@ -29,9 +32,25 @@ from ..value_objects import (CallbackStructValue,
                              TimerCallbackStructValue)
 
 
+@lru_cache(maxsize=1024)
+def _shared_topic_names(topic_names: Tuple[str, ...]) -> Tuple[str, ...]:
+    # Callbacks publishing the same topics share one tuple of interned names.
+    # The cache is bounded so that loading many applications does not grow it forever.
+    return tuple(intern(_) for _ in topic_names)
+
+
 class CallbackBase(PathBase, Summarizable):
     """A base class that represents callback."""
 
+    __slots__ = (
+        '_val',
+        '_provider',
+        '_sub',
+        '_timer',
+        '_pubs_sorted',
+        '_publish_topic_names_sorted',
+    )
+
     def __init__(
         self,
         info: CallbackStructValue,
@@ -58,11 +77,17 @@ class CallbackBase(PathBase, Summarizable):
 
         """
         super().__init__()
-        self.__val = info
+        self._val = info
         self._provider = records_provider
         self._sub = subscription
-        self._pubs = publishers
         self._timer = timer
+        self._pubs_sorted: Optional[Tuple[Publisher, ...]] = None
+        if publishers is not None:
+            self._pubs_sorted = tuple(sorted(publishers, key=attrgetter('topic_name')))
+        self._publish_topic_names_sorted: Optional[Tuple[str, ...]] = None
+        if info.publish_topic_names is not None:
+            self._publish_topic_names_sorted = \
+                _shared_topic_names(tuple(sorted(info.publish_topic_names)))
 
     @property
     def node_name(self) -> str:
@@ -75,7 +100,7 @@ class CallbackBase(PathBase, Summarizable):
             node name containing this callback.
 
         """
-        return self.__val.node_name
+        return self._val.node_name
 
     @property
     def symbol(self) -> str:
@@ -88,7 +113,7 @@ class CallbackBase(PathBase, Summarizable):
             callback function symbol name.
 
         """
-        return self.__val.symbol
+        return self._val.symbol
 
     @property
     def callback_name(self) -> str:
@@ -101,7 +126,7 @@ class CallbackBase(PathBase, Summarizable):
             callback name defined in architecture.
 
         """
-        return self.__val.callback_name
+        return self._val.callback_name
 
     @property
     def callback_type(self) -> CallbackType:
@@ -114,7 +139,7 @@ class CallbackBase(PathBase, Summarizable):
             callback type.
 
         """
-        return self.__val.callback_type
+        return self._val.callback_type
 
     @property
     def subscription(self) -> Optional[Subscription]:
@@ -131,19 +156,17 @@ class CallbackBase(PathBase, Summarizable):
         return self._sub
 
     @property
-    def publishers(self) -> Optional[List[Publisher]]:
+    def publishers(self) -> Optional[Tuple[Publisher, ...]]:
         """
         Get publishers.
 
         Returns
         -------
-        Optional[List[Publisher]]
+        Optional[Tuple[Publisher, ...]]
             publishers to which the callback publishes.
 
         """
-        if self._pubs is None:
-            return None
-        return sorted(self._pubs, key=lambda x: x.topic_name)
+        return self._pubs_sorted
 
     @property
     def timer(self) -> Optional[Timer]:
@@ -160,19 +183,17 @@ class CallbackBase(PathBase, Summarizable):
         return self._timer
 
     @property
-    def publish_topic_names(self) -> Optional[List[str]]:
+    def publish_topic_names(self) -> Optional[Tuple[str, ...]]:
         """
         Get publisher topic names.
 
         Returns
         -------
-        Optional[List[str]]
-            topic name list to be published by the callback.
+        Optional[Tuple[str, ...]]
+            topic names to be published by the callback.
 
         """
-        if self.__val.publish_topic_names is None:
-            return None
-        return sorted(self.__val.publish_topic_names)
+        return self._publish_topic_names_sorted
 
     @property
     def subscribe_topic_name(self) -> Optional[str]:
@@ -186,7 +207,7 @@ class CallbackBase(PathBase, Summarizable):
             None except for subscription callback.
 
         """
-        return self.__val.subscribe_topic_name
+        return self._val.subscribe_topic_name
 
     @property
     def summary(self) -> Summary:
@@ -199,7 +220,7 @@ class CallbackBase(PathBase, Summarizable):
             summary info.
 
         """
-        return self.__val.summary
+        return self._val.summary
 
     def _to_records_core(self) -> RecordsInterface:
         """
@@ -211,7 +232,7 @@ class CallbackBase(PathBase, Summarizable):
             callback duration (callback start - callback end).
 
         """
-        records = self._provider.callback_records(self.__val)
+        records = self._provider.callback_records(self._val)
 
         return records
 
@@ -219,6 +240,9 @@ class CallbackBase(PathBase, Summarizable):
 class TimerCallback(CallbackBase):
     """Class that represents timer callback."""
 
+    __slots__ = ()
+    _val: TimerCallbackStructValue
+
     def __init__(
         self,
         callback: TimerCallbackStructValue,
@@ -242,7 +266,6 @@ class TimerCallback(CallbackBase):
 
         """
         super().__init__(callback, records_provider, None, publishers, timer)
-        self.__val: TimerCallbackStructValue = callback
 
     @property
     def period_ns(self) -> int:
@@ -255,12 +278,14 @@ class TimerCallback(CallbackBase):
             timer period [ns].
 
         """
-        return self.__val.period_ns
+        return self._val.period_ns
 
 
 class SubscriptionCallback(CallbackBase):
     """A class that represents subscription callback."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         callback_info: SubscriptionCallbackStructValue,
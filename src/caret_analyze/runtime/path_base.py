@@ -27,6 +27,8 @@ from ..record.data_frame_shaper import DataFrameShaper, Strip
 class PathBase(metaclass=ABCMeta):
     """Base class for Latency."""
 
+    __slots__ = ('__records_cache',)
+
     def __init__(self) -> None:
         self.__records_cache: Optional[RecordsInterface] = None
 
@@ -12,6 +12,93 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from caret_analyze.infra.interface import RecordsProvider
+from caret_analyze.record import RecordsInterface
+from caret_analyze.runtime.callback import SubscriptionCallback, TimerCallback
+from caret_analyze.runtime.publisher import Publisher
+from caret_analyze.runtime.subscription import Subscription
+from caret_analyze.runtime.timer import Timer
+from caret_analyze.value_objects import (SubscriptionCallbackStructValue,
+                                         TimerCallbackStructValue)
+
+
+class TestCallbackBase:
+
+    def test_publishers(self, mocker):
+        provider_mock = mocker.Mock(spec=RecordsProvider)
+        timer_mock = mocker.Mock(spec=Timer)
+
+        pub_mock_0 = mocker.Mock(spec=Publisher)
+        mocker.patch.object(pub_mock_0, 'topic_name', '/topic_0')
+        pub_mock_1 = mocker.Mock(spec=Publisher)
+        mocker.patch.object(pub_mock_1, 'topic_name', '/topic_1')
+
+        cb_info = TimerCallbackStructValue(
+            '/node', 'symbol', 100, ('/topic_1', '/topic_0'), '/callback'
+        )
+        cb = TimerCallback(cb_info, provider_mock, [pub_mock_1, pub_mock_0], timer_mock)
+
+        assert cb.publishers == (pub_mock_0, pub_mock_1)
+        assert cb.publishers is cb.publishers
+        assert cb.publish_topic_names == ('/topic_0', '/topic_1')
+        assert cb.publish_topic_names is cb.publish_topic_names
+
+    def test_publishers_none(self, mocker):
+        provider_mock = mocker.Mock(spec=RecordsProvider)
+        timer_mock = mocker.Mock(spec=Timer)
+
+        cb_info = TimerCallbackStructValue('/node', 'symbol', 100, None, '/callback')
+        cb = TimerCallback(cb_info, provider_mock, None, timer_mock)
+
+        assert cb.publishers is None
+        assert cb.publish_topic_names is None
+
+    def test_publish_topic_names_shared(self, mocker):
+        provider_mock = mocker.Mock(spec=RecordsProvider)
+
+        cb_info_0 = TimerCallbackStructValue(
+            '/node', 'symbol', 100, ('/topic_0', '/topic_1'), '/callback_0')
+        cb_info_1 = TimerCallbackStructValue(
+            '/node', 'symbol', 100, ('/topic_1', '/topic_0'), '/callback_1')
+        cb_0 = TimerCallback(cb_info_0, provider_mock, None, mocker.Mock(spec=Timer))
+        cb_1 = TimerCallback(cb_info_1, provider_mock, None, mocker.Mock(spec=Timer))
+
+        assert cb_0.publish_topic_names == ('/topic_0', '/topic_1')
+        assert cb_0.publish_topic_names is cb_1.publish_topic_names
+
+    def test_slots(self, mocker):
+        provider_mock = mocker.Mock(spec=RecordsProvider)
+
+        timer_cb_info = TimerCallbackStructValue('/node', 'symbol', 100, None, '/timer_cb')
+        timer_cb = TimerCallback(
+            timer_cb_info, provider_mock, None, mocker.Mock(spec=Timer))
+
+        sub_cb_info = SubscriptionCallbackStructValue(
+            '/node', 'symbol', '/sub_topic', None, '/sub_cb')
+        sub_cb = SubscriptionCallback(
+            sub_cb_info, provider_mock, mocker.Mock(spec=Subscription))
+
+        assert not hasattr(timer_cb, '__dict__')
+        assert not hasattr(sub_cb, '__dict__')
+
+    def test_clear_cache(self, mocker):
+        provider_mock = mocker.Mock(spec=RecordsProvider)
+        records_mock = mocker.Mock(spec=RecordsInterface)
+        mocker.patch.object(records_mock, 'clone', return_value=records_mock)
+        mocker.patch.object(provider_mock, 'callback_records', return_value=records_mock)
+
+        cb_info = TimerCallbackStructValue('/node', 'symbol', 100, None, '/callback')
+        cb = TimerCallback(cb_info, provider_mock, None, mocker.Mock(spec=Timer))
+
+        cb.to_records()
+        cb.to_records()
+        assert provider_mock.callback_records.call_count == 1
+
+        cb.clear_cache()
+        cb.to_records()
+        assert provider_mock.callback_records.call_count == 2
+
+
 # from caret_analyze.application import Application
 # from caret_analyze.callback import CallbackBase, SubscriptionCallback
 # from caret_analyze.trace.lttng import Lttng
@@ -571,8 +571,8 @@ class TestCallbacksLoaded:
         assert cb.node_name == node_name
         assert cb.period_ns == period_ns
         assert cb.symbol == symbol
-        assert cb.publishers == [pub_mock]
-        assert cb.publish_topic_names == [pub_topic_name]
+        assert cb.publishers == (pub_mock,)
+        assert cb.publish_topic_names == (pub_topic_name,)
 
     def test_to_runtime_subscription_callback(self, mocker):
         provider_mock = mocker.Mock(spec=RecordsProvider)
@@ -602,11 +602,11 @@ class TestCallbacksLoaded:
         assert isinstance(cb, SubscriptionCallback)
         assert cb.callback_name == cb_name
         assert cb.node_name == node_name
-        assert cb.publishers == [pub_mock]
+        assert cb.publishers == (pub_mock,)
         assert cb.subscription == sub_mock
         assert cb.subscribe_topic_name == sub_topic
         assert cb.symbol == symbol
-        assert cb.publish_topic_names == [pub_topic]
+        assert cb.publish_topic_names == (pub_topic,)
 
 
 class TestCallbackGroupsLoaded: